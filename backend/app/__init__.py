@@ -2,39 +2,58 @@
 Flask Application Factory
 """
 from flask import Flask, jsonify
+import importlib
 from flask_sqlalchemy import SQLAlchemy
-from flask_migrate import Migrate
 from flask_jwt_extended import JWTManager
-from flask_cors import CORS
 from config import Config
 
 db = SQLAlchemy()
-migrate = Migrate()
 jwt = JWTManager()
 
 
 def create_app(config_class=Config):
-    """Create and configure the Flask application"""
+    """
+    Create and configure the Flask application
+
+    Safe to call before a server forks workers: no database connections or
+    job threads are opened here, and reset_after_fork() drops anything a
+    worker inherits from the parent process.
+    """
     app = Flask(__name__)
     app.config.from_object(config_class)
 
     # Initialize extensions
     db.init_app(app)
-    migrate.init_app(app, db)
     jwt.init_app(app)
+
+    # Optional extensions are only imported when enabled, which keeps
+    # alembic and flask_cors out of tests and short-lived CLI processes
+    if app.config['ENABLE_MIGRATE']:
+        from flask_migrate import Migrate
+        Migrate(app, db)
     
-    # CORS configuration for development
-    CORS(app, 
-         resources={r"/*": {"origins": "*"}},
-         allow_headers=["Content-Type", "Authorization"],
-         methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-         supports_credentials=True)
-
-    # Register blueprints
-    from app.routes import auth, projects, time_entries
-    app.register_blueprint(auth.bp)
-    app.register_blueprint(projects.bp)
-    app.register_blueprint(time_entries.bp)
+    if app.config['ENABLE_CORS']:
+        from flask_cors import CORS
+        # CORS configuration for development
+        CORS(app, 
+             resources={r"/*": {"origins": "*"}},
+             allow_headers=["Content-Type", "Authorization"],
+             methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+             supports_credentials=True)
+
+    # Background job queue and the tasks it can run
+    from app.jobs import job_queue
+    from app import tasks  # noqa: F401 - registers task handlers
+    job_queue.init_app(app)
+
+    # Register only the blueprints this app is configured to serve
+    for name in app.config['BLUEPRINTS']:
+        module = importlib.import_module(f'app.routes.{name}')
+        app.register_blueprint(module.bp)
+
+    # CLI commands
+    from app.commands import archive_entries_command
+    app.cli.add_command(archive_entries_command)
     
     # JWT error handlers
     @jwt.expired_token_loader
@@ -53,3 +72,11 @@ def create_app(config_class=Config):
         return jsonify({'message': 'Authorization token is missing'}), 401
 
     return app
+
+
+def reset_after_fork(app):
+    """Drop connection pools and job threads inherited from a parent process"""
+    from app.jobs import job_queue
+    with app.app_context():
+        db.engine.dispose(close=False)
+    job_queue.reset_after_fork()
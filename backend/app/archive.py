@@ -0,0 +1,177 @@
+"""
+Time Entry Archive
+
+Moves closed-out time entries into cold storage and reads them back when a
+query's date range reaches into archived history.
+"""
+from datetime import datetime, timezone
+from sqlalchemy import select, insert, delete, func, literal, case, and_, not_
+from app import db
+from app.models.time_entry import TimeEntry
+from app.models.archived_time_entry import ArchivedTimeEntry
+from app.models.time_entry_summary import TimeEntryMonthlySummary
+
+ARCHIVED_COLUMNS = [
+    'id', 'user_id', 'project_id', 'start_time', 'end_time', 'duration',
+    'notes', 'is_billable', 'created_at', 'updated_at'
+]
+
+
+def naive_utc(dt):
+    """Convert an aware datetime to naive UTC, the form start_time is stored in"""
+    if dt is not None and dt.tzinfo is not None:
+        return dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def month_start(dt):
+    """Return midnight on the first day of the month containing dt"""
+    return datetime(dt.year, dt.month, 1)
+
+
+def next_month(dt):
+    """Return midnight on the first day of the month after dt"""
+    if dt.month == 12:
+        return datetime(dt.year + 1, 1, 1)
+    return datetime(dt.year, dt.month + 1, 1)
+
+
+def archive_entries(before):
+    """
+    Move every finished time entry that started before the month containing
+    `before` into archived_time_entries, folding it into the monthly
+    summaries. Running timers (no end_time) stay live so they can be stopped.
+
+    The cutoff is rounded down to a month boundary so each summary row
+    covers a whole month. Returns (cutoff, number of entries archived).
+    """
+    cutoff = month_start(before)
+    to_archive = and_(TimeEntry.start_time < cutoff, TimeEntry.end_time.isnot(None))
+
+    # Aggregate before moving so summaries and archive stay in one transaction
+    totals = {}
+    rows = db.session.execute(
+        select(TimeEntry.user_id, TimeEntry.project_id, TimeEntry.start_time,
+               TimeEntry.duration, TimeEntry.is_billable).where(to_archive)
+    )
+    for user_id, project_id, start_time, duration, is_billable in rows:
+        key = (user_id, project_id, month_start(start_time).date())
+        count, total, billable = totals.get(key, (0, 0, 0))
+        duration = duration or 0
+        totals[key] = (count + 1, total + duration, billable + (duration if is_billable else 0))
+
+    if not totals:
+        return cutoff, 0
+
+    try:
+        for (user_id, project_id, month), (count, total, billable) in totals.items():
+            summary = TimeEntryMonthlySummary.query.filter_by(
+                user_id=user_id, project_id=project_id, month=month
+            ).first()
+            if summary is None:
+                summary = TimeEntryMonthlySummary(
+                    user_id=user_id, project_id=project_id, month=month,
+                    entry_count=0, total_duration=0, billable_duration=0
+                )
+                db.session.add(summary)
+            summary.entry_count += count
+            summary.total_duration += total
+            summary.billable_duration += billable
+
+        columns = [getattr(TimeEntry, name) for name in ARCHIVED_COLUMNS]
+        db.session.execute(
+            insert(ArchivedTimeEntry).from_select(
+                ARCHIVED_COLUMNS + ['archived_at'],
+                select(*columns, literal(datetime.utcnow())).where(to_archive)
+            )
+        )
+        result = db.session.execute(delete(TimeEntry).where(to_archive))
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    return cutoff, result.rowcount
+
+
+def reaches_archive(start_dt):
+    """Return True if a range starting at start_dt overlaps archived entries"""
+    newest = db.session.query(func.max(ArchivedTimeEntry.start_time)).scalar()
+    if newest is None:
+        return False
+    return start_dt is None or start_dt <= newest
+
+
+def _archived_query(user_id, project_id, start_dt, end_dt):
+    query = ArchivedTimeEntry.query.filter_by(user_id=user_id)
+    if project_id:
+        query = query.filter_by(project_id=project_id)
+    if start_dt:
+        query = query.filter(ArchivedTimeEntry.start_time >= start_dt)
+    if end_dt:
+        query = query.filter(ArchivedTimeEntry.start_time <= end_dt)
+    return query
+
+
+def get_archived_entries(user_id, project_id=None, start_dt=None, end_dt=None, is_billable=None):
+    """Return archived entries matching the same filters as live entries"""
+    query = _archived_query(user_id, project_id, start_dt, end_dt)
+    if is_billable is not None:
+        query = query.filter_by(is_billable=is_billable)
+    return query.order_by(ArchivedTimeEntry.start_time.desc()).all()
+
+
+def get_archived_totals(user_id, project_id=None, start_dt=None, end_dt=None):
+    """
+    Return (entry_count, total_duration, billable_duration) for archived
+    entries in the range.
+
+    Months the range covers entirely are read from the frozen monthly
+    summaries; only the partial months at either edge scan archived rows.
+    """
+    # Months in [first_full, last_full) are fully inside the range
+    if start_dt is None:
+        first_full = None
+    elif start_dt == month_start(start_dt):
+        first_full = start_dt
+    else:
+        first_full = next_month(start_dt)
+    last_full = month_start(end_dt) if end_dt else None
+    has_full_months = first_full is None or last_full is None or first_full < last_full
+
+    count = total = billable = 0
+
+    if has_full_months:
+        summaries = db.session.query(
+            func.coalesce(func.sum(TimeEntryMonthlySummary.entry_count), 0),
+            func.coalesce(func.sum(TimeEntryMonthlySummary.total_duration), 0),
+            func.coalesce(func.sum(TimeEntryMonthlySummary.billable_duration), 0)
+        ).filter(TimeEntryMonthlySummary.user_id == user_id)
+        if project_id:
+            summaries = summaries.filter(TimeEntryMonthlySummary.project_id == project_id)
+        if first_full:
+            summaries = summaries.filter(TimeEntryMonthlySummary.month >= first_full.date())
+        if last_full:
+            summaries = summaries.filter(TimeEntryMonthlySummary.month < last_full.date())
+        count, total, billable = summaries.one()
+
+    rows = _archived_query(user_id, project_id, start_dt, end_dt)
+    if has_full_months:
+        in_full_months = []
+        if first_full:
+            in_full_months.append(ArchivedTimeEntry.start_time >= first_full)
+        if last_full:
+            in_full_months.append(ArchivedTimeEntry.start_time < last_full)
+        if not in_full_months:
+            # Unbounded range: the summaries already cover everything
+            return count, total, billable
+        rows = rows.filter(not_(and_(*in_full_months)))
+    edge = rows.with_entities(
+        func.count(ArchivedTimeEntry.id),
+        func.coalesce(func.sum(ArchivedTimeEntry.duration), 0),
+        func.coalesce(func.sum(
+            case((ArchivedTimeEntry.is_billable, ArchivedTimeEntry.duration), else_=0)
+        ), 0)
+    ).one()
+
+    return count + edge[0], total + edge[1], billable + edge[2]
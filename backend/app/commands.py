@@ -0,0 +1,22 @@
+"""
+CLI Commands
+"""
+from datetime import datetime
+import click
+from flask.cli import with_appcontext
+from app.archive import archive_entries
+
+
+@click.command('archive-entries')
+@click.option('--before', required=True,
+              help='ISO date; entries that started before this month are archived.')
+@with_appcontext
+def archive_entries_command(before):
+    """Move old time entries into the archive table"""
+    try:
+        before_dt = datetime.fromisoformat(before)
+    except ValueError:
+        raise click.BadParameter('Invalid date format', param_hint='--before')
+
+    cutoff, archived = archive_entries(before_dt)
+    click.echo(f'Archived {archived} time entries that started before {cutoff.date().isoformat()}')
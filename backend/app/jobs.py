@@ -0,0 +1,172 @@
+"""
+Background Job Queue
+
+A lightweight in-process queue: jobs are persisted in the jobs table and run
+on a thread pool, so heavy work (project deletion, exports, rebuilds) does not
+hold up the request that asked for it.
+"""
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import update, func
+from app import db
+from app.models.job import Job
+
+
+# (job id, attempt) of the job running in the current thread
+_current_job = contextvars.ContextVar('current_job', default=None)
+
+
+class JobLost(Exception):
+    """Raised in a running job whose claim was taken over after it was presumed abandoned"""
+
+
+class JobQueue:
+    """Thread pool backed job queue, initialised per app like other extensions"""
+
+    def __init__(self, app=None):
+        self.tasks = {}
+        self._executor = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        # Jobs run against whichever app enqueued them, so one queue serves many apps
+        app.extensions['job_queue'] = self
+
+    def task(self, name):
+        """Register a function as the handler for jobs called `name`"""
+        def decorator(func):
+            self.tasks[name] = func
+            return func
+        return decorator
+
+    @property
+    def executor(self):
+        # Created on first use so no threads exist before a server forks workers
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=current_app.config.get('JOB_WORKERS', 2),
+                thread_name_prefix='job'
+            )
+        return self._executor
+
+    def enqueue(self, name, user_id=None, **payload):
+        """Persist a new job and hand it to the thread pool"""
+        if name not in self.tasks:
+            raise KeyError(f'Unknown job: {name}')
+
+        job = Job(name=name, user_id=user_id, payload=payload)
+        db.session.add(job)
+        db.session.commit()
+
+        self._dispatch(job.id)
+        if current_app.config.get('JOB_RUN_INLINE'):
+            db.session.refresh(job)
+        return job
+
+    def _dispatch(self, job_id):
+        app = current_app._get_current_object()
+        if app.config.get('JOB_RUN_INLINE'):
+            self._run(app, job_id)
+        else:
+            self.executor.submit(self._run, app, job_id)
+
+    def _run(self, app, job_id):
+        with app.app_context():
+            # Claim the job atomically so a requeued job never runs twice
+            now = datetime.utcnow()
+            claimed = db.session.execute(
+                update(Job)
+                .where(Job.id == job_id, Job.status == 'queued')
+                .values(status='running', started_at=now, heartbeat_at=now, attempts=Job.attempts + 1)
+            )
+            db.session.commit()
+            if not claimed.rowcount:
+                return
+
+            job = db.session.get(Job, job_id)
+            token = _current_job.set((job_id, job.attempts))
+            try:
+                result = self.tasks[job.name](**(job.payload or {}))
+                job.status = 'completed'
+                job.result = result
+            except JobLost:
+                # Another run owns the job now; leave its row alone
+                print(f"[ERROR] Job {job_id} ({job.name}) was taken over; stopping")  # Debug logging
+                db.session.rollback()
+                return
+            except Exception as e:
+                print(f"[ERROR] Job {job_id} ({job.name}) failed: {str(e)}")  # Debug logging
+                db.session.rollback()
+                job = db.session.get(Job, job_id)
+                job.status = 'failed'
+                job.error = str(e)
+            finally:
+                _current_job.reset(token)
+
+            job.finished_at = datetime.utcnow()
+            db.session.commit()
+
+    def heartbeat(self):
+        """
+        Record progress for the job running in this thread, in the caller's
+        transaction. Raises JobLost if the job was requeued and claimed again.
+        """
+        current = _current_job.get()
+        if current is None:
+            return
+        job_id, attempt = current
+        touched = db.session.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.status == 'running', Job.attempts == attempt)
+            .values(heartbeat_at=datetime.utcnow())
+        )
+        if not touched.rowcount:
+            raise JobLost(f'Job {job_id} was taken over')
+
+    def _stale_cutoff(self):
+        return datetime.utcnow() - timedelta(seconds=current_app.config.get('JOB_STALE_AFTER', 3600))
+
+    def is_stale(self, job):
+        """True if a queued job has waited, or a running job gone silent, longer than JOB_STALE_AFTER"""
+        cutoff = self._stale_cutoff()
+        if job.status == 'running':
+            return (job.heartbeat_at or job.started_at) < cutoff
+        if job.status == 'queued':
+            return job.created_at < cutoff
+        return False
+
+    def requeue_stale(self):
+        """
+        Resubmit jobs left queued, or running without a heartbeat, by a process
+        that exited, e.g. a recycled gunicorn worker. Returns the number of
+        jobs resubmitted.
+        """
+        cutoff = self._stale_cutoff()
+        db.session.execute(
+            update(Job)
+            .where(Job.status == 'running', func.coalesce(Job.heartbeat_at, Job.started_at) < cutoff)
+            .values(status='queued')
+        )
+        db.session.commit()
+
+        job_ids = [job_id for (job_id,) in db.session.query(Job.id).filter(
+            Job.status == 'queued', Job.created_at < cutoff
+        ).order_by(Job.id)]
+        for job_id in job_ids:
+            self._dispatch(job_id)
+        return len(job_ids)
+
+    def reset_after_fork(self):
+        # A forked worker inherits the pool object but none of its threads
+        self._executor = None
+
+    def shutdown(self, wait=True):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+
+job_queue = JobQueue()
@@ -4,5 +4,9 @@ Database Models
 from app.models.user import User
 from app.models.project import Project
 from app.models.time_entry import TimeEntry
+from app.models.archived_time_entry import ArchivedTimeEntry
+from app.models.time_entry_summary import TimeEntryMonthlySummary
+from app.models.job import Job
+from app.models.revoked_token import RevokedToken
 
-__all__ = ['User', 'Project', 'TimeEntry']
+__all__ = ['User', 'Project', 'TimeEntry', 'ArchivedTimeEntry', 'TimeEntryMonthlySummary', 'Job', 'RevokedToken']
@@ -0,0 +1,43 @@
+"""
+Job Model
+"""
+from datetime import datetime
+from app import db
+
+
+class Job(db.Model):
+    """Background job persisted so its status survives the request that queued it"""
+    __tablename__ = 'jobs'
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(80), nullable=False, index=True)  # Registered task name
+    status = db.Column(db.String(20), default='queued', nullable=False, index=True)  # queued, running, completed, failed
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), index=True)
+    payload = db.Column(db.JSON)
+    result = db.Column(db.JSON)
+    error = db.Column(db.Text)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime)
+    heartbeat_at = db.Column(db.DateTime)  # Last progress report from the running task
+    attempts = db.Column(db.Integer, default=0, nullable=False)  # Bumped on every claim
+    finished_at = db.Column(db.DateTime)
+
+    def to_dict(self):
+        """Convert job object to dictionary"""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'status': self.status,
+            'payload': self.payload,
+            'result': self.result,
+            'error': self.error,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'heartbeat_at': self.heartbeat_at.isoformat() if self.heartbeat_at else None,
+            'attempts': self.attempts,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
+
+    def __repr__(self):
+        return f'<Job {self.id} {self.name} ({self.status})>'
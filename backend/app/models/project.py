@@ -3,6 +3,7 @@ Project Model
 """
 from datetime import datetime
 from app import db
+from app.models.time_entry_summary import TimeEntryMonthlySummary
 
 
 class Project(db.Model):
@@ -12,13 +13,23 @@ class Project(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(200), nullable=False, index=True)
     description = db.Column(db.Text)
-    status = db.Column(db.String(20), default='active', nullable=False)  # active, archived, completed
+    status = db.Column(db.String(20), default='active', nullable=False)  # active, archived, completed, deleting
     color = db.Column(db.String(7), default='#3B82F6')  # Hex color for UI
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
     time_entries = db.relationship('TimeEntry', backref='project', lazy='dynamic', cascade='all, delete-orphan')
+    archived_time_entries = db.relationship('ArchivedTimeEntry', backref='project', lazy='dynamic', cascade='all, delete-orphan')
+    monthly_summaries = db.relationship('TimeEntryMonthlySummary', backref='project', lazy='dynamic', cascade='all, delete-orphan')
+
+    @classmethod
+    def get_visible(cls, project_id):
+        """Get a project by id, treating one queued for deletion as missing"""
+        project = cls.query.get(project_id)
+        if not project or project.status == 'deleting':
+            return None
+        return project
 
     def to_dict(self, include_stats=False):
         """Convert project object to dictionary"""
@@ -34,8 +45,18 @@ class Project(db.Model):
         
         if include_stats:
             total_duration = sum(entry.duration for entry in self.time_entries if entry.duration)
+            entry_count = self.time_entries.count()
+            
+            # Archived entries only survive as frozen monthly totals
+            archived_count, archived_duration = self.monthly_summaries.with_entities(
+                db.func.coalesce(db.func.sum(TimeEntryMonthlySummary.entry_count), 0),
+                db.func.coalesce(db.func.sum(TimeEntryMonthlySummary.total_duration), 0)
+            ).one()
+            total_duration += archived_duration
+            entry_count += archived_count
+            
             data['total_hours'] = round(total_duration / 3600, 2) if total_duration else 0
-            data['entry_count'] = self.time_entries.count()
+            data['entry_count'] = entry_count
         
         return data
 
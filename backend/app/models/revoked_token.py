@@ -0,0 +1,23 @@
+"""
+Revoked Token Model
+"""
+from datetime import datetime
+from app import db
+
+
+class RevokedToken(db.Model):
+    """JWT revoked at logout, shared by every server process"""
+    __tablename__ = 'revoked_tokens'
+
+    id = db.Column(db.Integer, primary_key=True)
+    jti = db.Column(db.String(36), unique=True, nullable=False, index=True)
+    expires_at = db.Column(db.DateTime)  # Rows past this can be purged
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    @classmethod
+    def is_revoked(cls, jti):
+        """Return True if the token with this jti was revoked"""
+        return db.session.query(cls.query.filter_by(jti=jti).exists()).scalar()
+
+    def __repr__(self):
+        return f'<RevokedToken {self.jti}>'
@@ -8,6 +8,8 @@ from app import db
 class TimeEntry(db.Model):
     """Time entry model for tracking work hours"""
     __tablename__ = 'time_entries'
+    # Archived entries keep their id, so SQLite must never hand a freed rowid out again
+    __table_args__ = {'sqlite_autoincrement': True}
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
@@ -43,6 +45,7 @@ class TimeEntry(db.Model):
             'duration_hours': round(self.duration / 3600, 2) if self.duration else None,
             'notes': self.notes,
             'is_billable': self.is_billable,
+            'is_archived': False,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
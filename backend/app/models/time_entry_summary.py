@@ -0,0 +1,27 @@
+"""
+Monthly Time Entry Summary Model
+"""
+from datetime import datetime
+from app import db
+
+
+class TimeEntryMonthlySummary(db.Model):
+    """Frozen per-(user, project, month) totals for archived time entries"""
+    __tablename__ = 'time_entry_monthly_summaries'
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'project_id', 'month', name='uq_summary_user_project_month'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
+    project_id = db.Column(db.Integer, db.ForeignKey('projects.id'), nullable=False, index=True)
+    month = db.Column(db.Date, nullable=False, index=True)  # First day of the month
+
+    entry_count = db.Column(db.Integer, default=0, nullable=False)
+    total_duration = db.Column(db.Integer, default=0, nullable=False)  # Seconds
+    billable_duration = db.Column(db.Integer, default=0, nullable=False)  # Seconds
+
+    frozen_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<TimeEntryMonthlySummary {self.user_id}/{self.project_id} {self.month}>'
@@ -22,6 +22,8 @@ class User(db.Model):
 
     # Relationships
     time_entries = db.relationship('TimeEntry', backref='user', lazy='dynamic', cascade='all, delete-orphan')
+    archived_time_entries = db.relationship('ArchivedTimeEntry', backref='user', lazy='dynamic', cascade='all, delete-orphan')
+    monthly_summaries = db.relationship('TimeEntryMonthlySummary', backref='user', lazy='dynamic', cascade='all, delete-orphan')
 
     def set_password(self, password):
         """Hash and set the user password"""
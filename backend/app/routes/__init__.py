@@ -1,6 +1,7 @@
 """
 Routes Package
+
+Blueprint modules are imported by create_app according to Config.BLUEPRINTS.
 """
-from app.routes import auth, projects, time_entries
 
-__all__ = ['auth', 'projects', 'time_entries']
+__all__ = ['auth', 'projects', 'time_entries', 'jobs']
@@ -10,13 +10,12 @@ from flask_jwt_extended import (
     get_jwt
 )
 from app import db
+from datetime import datetime
 from app.models.user import User
+from app.models.revoked_token import RevokedToken
 
 bp = Blueprint('auth', __name__, url_prefix='/auth')
 
-# Token blacklist (in production, use Redis or database)
-blacklisted_tokens = set()
-
 
 @bp.route('/register', methods=['POST'])
 def register():
@@ -96,9 +95,12 @@ def login():
 @bp.route('/logout', methods=['POST'])
 @jwt_required()
 def logout():
-    """Logout user by blacklisting the token"""
-    jti = get_jwt()['jti']
-    blacklisted_tokens.add(jti)
+    """Logout user by revoking the token"""
+    token = get_jwt()
+    
+    # Stored in the database so every server worker sees the revocation
+    db.session.add(RevokedToken(jti=token['jti'], expires_at=datetime.utcfromtimestamp(token['exp'])))
+    db.session.commit()
     
     return jsonify({'message': 'Logout successful'}), 200
 
@@ -126,10 +128,9 @@ def get_current_user():
     return jsonify(user.to_dict()), 200
 
 
-# JWT token blacklist check
+# JWT token revocation check
 from app import jwt as jwt_manager
 
 @jwt_manager.token_in_blocklist_loader
 def check_if_token_in_blacklist(jwt_header, jwt_payload):
-    jti = jwt_payload['jti']
-    return jti in blacklisted_tokens
+    return RevokedToken.is_revoked(jwt_payload['jti'])
@@ -0,0 +1,21 @@
+"""
+Job Routes
+"""
+from flask import Blueprint, jsonify
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.models.job import Job
+
+bp = Blueprint('jobs', __name__, url_prefix='/api/jobs')
+
+
+@bp.route('/<int:job_id>', methods=['GET'])
+@jwt_required()
+def get_job(job_id):
+    """Get the status of a background job"""
+    current_user_id = int(get_jwt_identity())
+    job = Job.query.filter_by(id=job_id, user_id=current_user_id).first()
+    
+    if not job:
+        return jsonify({'message': 'Job not found'}), 404
+    
+    return jsonify(job.to_dict()), 200
@@ -3,8 +3,11 @@ Project Routes
 """
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from datetime import datetime
 from app import db
 from app.models.project import Project
+from app.jobs import job_queue
+from app.tasks import latest_delete_job
 
 bp = Blueprint('projects', __name__, url_prefix='/api/projects')
 
@@ -20,6 +23,8 @@ def get_projects():
     
     if status:
         query = query.filter_by(status=status)
+    else:
+        query = query.filter(Project.status != 'deleting')
     
     projects = query.order_by(Project.created_at.desc()).all()
     
@@ -30,7 +35,7 @@ def get_projects():
 @jwt_required()
 def get_project(project_id):
     """Get a specific project"""
-    project = Project.query.get(project_id)
+    project = Project.get_visible(project_id)
     
     if not project:
         return jsonify({'message': 'Project not found'}), 404
@@ -77,13 +82,17 @@ def create_project():
 @jwt_required()
 def update_project(project_id):
     """Update an existing project"""
-    project = Project.query.get(project_id)
+    project = Project.get_visible(project_id)
     
     if not project:
         return jsonify({'message': 'Project not found'}), 404
     
     data = request.get_json()
     
+    # 'deleting' is only ever set by delete_project
+    if data.get('status') == 'deleting':
+        return jsonify({'message': 'Invalid project status'}), 400
+    
     if 'name' in data:
         project.name = data['name']
     if 'description' in data:
@@ -104,13 +113,36 @@ def update_project(project_id):
 @bp.route('/<int:project_id>', methods=['DELETE'])
 @jwt_required()
 def delete_project(project_id):
-    """Delete a project"""
+    """Queue a project for deletion"""
     project = Project.query.get(project_id)
     
     if not project:
         return jsonify({'message': 'Project not found'}), 404
     
-    db.session.delete(project)
+    previous_status = project.status
+    
+    if project.status == 'deleting':
+        # Only retry when the last deletion failed or was abandoned by a dead worker
+        job = latest_delete_job(project.id)
+        if job and job.status in ('queued', 'running'):
+            if not job_queue.is_stale(job):
+                return jsonify({
+                    'message': 'Project deletion already queued',
+                    'job': job.to_dict()
+                }), 202
+            job.status = 'failed'
+            job.error = 'Abandoned; deletion requeued'
+            job.finished_at = datetime.utcnow()
+        previous_status = (job.payload or {}).get('previous_status', 'active') if job else 'active'
+    
+    # Deleting a large project's entries runs as a background job
+    project.status = 'deleting'
     db.session.commit()
     
-    return jsonify({'message': 'Project deleted successfully'}), 200
+    job = job_queue.enqueue('delete_project', user_id=int(get_jwt_identity()),
+                            project_id=project.id, previous_status=previous_status)
+    
+    return jsonify({
+        'message': 'Project deletion queued',
+        'job': job.to_dict()
+    }), 202
@@ -7,6 +7,7 @@ from datetime import datetime
 from app import db
 from app.models.time_entry import TimeEntry
 from app.models.project import Project
+from app import archive
 
 bp = Blueprint('time_entries', __name__, url_prefix='/api/entries')
 
@@ -23,6 +24,7 @@ def get_time_entries():
     end_date = request.args.get('end_date')
     is_billable = request.args.get('is_billable')
     
+    start_dt = end_dt = None
     query = TimeEntry.query.filter_by(user_id=current_user_id)
     
     if project_id:
@@ -30,23 +32,29 @@ def get_time_entries():
     
     if start_date:
         try:
-            start_dt = datetime.fromisoformat(start_date)
+            start_dt = archive.naive_utc(datetime.fromisoformat(start_date.replace('Z', '+00:00')))
             query = query.filter(TimeEntry.start_time >= start_dt)
         except ValueError:
             return jsonify({'message': 'Invalid start_date format'}), 400
     
     if end_date:
         try:
-            end_dt = datetime.fromisoformat(end_date)
+            end_dt = archive.naive_utc(datetime.fromisoformat(end_date.replace('Z', '+00:00')))
             query = query.filter(TimeEntry.start_time <= end_dt)
         except ValueError:
             return jsonify({'message': 'Invalid end_date format'}), 400
     
     if is_billable is not None:
-        query = query.filter_by(is_billable=is_billable.lower() == 'true')
+        is_billable = is_billable.lower() == 'true'
+        query = query.filter_by(is_billable=is_billable)
     
     entries = query.order_by(TimeEntry.start_time.desc()).all()
     
+    # Only touch cold storage when the range reaches back into it
+    if archive.reaches_archive(start_dt):
+        entries += archive.get_archived_entries(current_user_id, project_id, start_dt, end_dt, is_billable)
+        entries.sort(key=lambda entry: entry.start_time, reverse=True)
+    
     return jsonify([entry.to_dict() for entry in entries]), 200
 
 
@@ -74,7 +82,7 @@ def create_time_entry():
         return jsonify({'message': 'project_id and start_time are required'}), 400
     
     # Verify project exists
-    project = Project.query.get(data['project_id'])
+    project = Project.get_visible(data['project_id'])
     if not project:
         return jsonify({'message': 'Project not found'}), 404
     
@@ -122,7 +130,7 @@ def update_time_entry(entry_id):
     data = request.get_json()
     
     if 'project_id' in data:
-        project = Project.query.get(data['project_id'])
+        project = Project.get_visible(data['project_id'])
         if not project:
             return jsonify({'message': 'Project not found'}), 404
         entry.project_id = data['project_id']
@@ -184,6 +192,7 @@ def get_summary():
     start_date = request.args.get('start_date')
     end_date = request.args.get('end_date')
     
+    start_dt = end_dt = None
     query = TimeEntry.query.filter_by(user_id=current_user_id)
     
     if project_id:
@@ -191,25 +200,34 @@ def get_summary():
     
     if start_date:
         try:
-            start_dt = datetime.fromisoformat(start_date)
+            start_dt = archive.naive_utc(datetime.fromisoformat(start_date.replace('Z', '+00:00')))
             query = query.filter(TimeEntry.start_time >= start_dt)
         except ValueError:
             return jsonify({'message': 'Invalid start_date format'}), 400
     
     if end_date:
         try:
-            end_dt = datetime.fromisoformat(end_date)
+            end_dt = archive.naive_utc(datetime.fromisoformat(end_date.replace('Z', '+00:00')))
             query = query.filter(TimeEntry.start_time <= end_dt)
         except ValueError:
             return jsonify({'message': 'Invalid end_date format'}), 400
     
     entries = query.all()
     
+    total_entries = len(entries)
     total_duration = sum(entry.duration for entry in entries if entry.duration)
     billable_duration = sum(entry.duration for entry in entries if entry.duration and entry.is_billable)
     
+    if archive.reaches_archive(start_dt):
+        archived_count, archived_total, archived_billable = archive.get_archived_totals(
+            current_user_id, project_id, start_dt, end_dt
+        )
+        total_entries += archived_count
+        total_duration += archived_total
+        billable_duration += archived_billable
+    
     return jsonify({
-        'total_entries': len(entries),
+        'total_entries': total_entries,
         'total_hours': round(total_duration / 3600, 2) if total_duration else 0,
         'billable_hours': round(billable_duration / 3600, 2) if billable_duration else 0,
         'non_billable_hours': round((total_duration - billable_duration) / 3600, 2) if total_duration else 0
@@ -0,0 +1,65 @@
+"""
+Background Tasks
+"""
+from flask import current_app
+from sqlalchemy import select, delete, update
+from app import db
+from app.jobs import job_queue, JobLost
+from app.models.job import Job
+from app.models.project import Project
+from app.models.time_entry import TimeEntry
+from app.models.archived_time_entry import ArchivedTimeEntry
+from app.models.time_entry_summary import TimeEntryMonthlySummary
+
+
+def delete_in_batches(model, project_id, batch_size):
+    """Delete a project's rows from `model` in set-based batches, committing each one"""
+    deleted = 0
+    while True:
+        batch = select(model.id).where(model.project_id == project_id).limit(batch_size)
+        result = db.session.execute(delete(model).where(model.id.in_(batch)))
+        job_queue.heartbeat()
+        db.session.commit()
+        if not result.rowcount:
+            return deleted
+        deleted += result.rowcount
+
+
+def latest_delete_job(project_id):
+    """Return the most recent delete_project job for a project, if any"""
+    return Job.query.filter(
+        Job.name == 'delete_project',
+        Job.payload['project_id'].as_integer() == project_id
+    ).order_by(Job.id.desc()).first()
+
+
+@job_queue.task('delete_project')
+def delete_project(project_id, previous_status='active'):
+    """Delete a project and everything attached to it without loading rows into memory"""
+    batch_size = current_app.config.get('JOB_BATCH_SIZE', 1000)
+
+    try:
+        result = {
+            'project_id': project_id,
+            'time_entries': delete_in_batches(TimeEntry, project_id, batch_size),
+            'archived_time_entries': delete_in_batches(ArchivedTimeEntry, project_id, batch_size),
+            'monthly_summaries': delete_in_batches(TimeEntryMonthlySummary, project_id, batch_size)
+        }
+
+        db.session.execute(delete(Project).where(Project.id == project_id))
+        job_queue.heartbeat()
+        db.session.commit()
+    except JobLost:
+        # The run that took over owns the project's status now
+        db.session.rollback()
+        raise
+    except Exception:
+        # Make the project visible again so the deletion can be retried
+        db.session.rollback()
+        db.session.execute(
+            update(Project).where(Project.id == project_id).values(status=previous_status)
+        )
+        db.session.commit()
+        raise
+
+    return result
@@ -0,0 +1,11 @@
+"""
+Production ASGI entry point for uvicorn and other ASGI servers
+
+    uvicorn asgi:app --host 0.0.0.0 --port 5000 --workers 4
+
+Flask is a WSGI framework; asgiref runs each request on a thread pool.
+"""
+from asgiref.wsgi import WsgiToAsgi
+from wsgi import app as wsgi_app
+
+app = WsgiToAsgi(wsgi_app)
@@ -0,0 +1,138 @@
+"""
+Load test: compare request throughput of the Flask dev server and gunicorn
+
+    python benchmarks/load_test.py --server both --requests 2000 --concurrency 16
+
+Each server is started against a throwaway SQLite database, a user is
+registered and logged in, and the authenticated GET /api/entries endpoint is
+hit with a fixed number of concurrent requests. Gunicorn picks up the same
+SERVER_* environment variables as production, so worker/thread settings can
+be sized from the results.
+"""
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(kind, port, env):
+    if kind == 'dev':
+        # Same threaded Werkzeug server that run.py starts
+        cmd = [sys.executable, '-m', 'flask', '--app', 'run.py', 'run', '--port', str(port)]
+    else:
+        cmd = [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py',
+               '--bind', f'127.0.0.1:{port}', 'wsgi:app']
+    return subprocess.Popen(cmd, cwd=BACKEND_DIR, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def request(url, data=None, token=None):
+    headers = {'Content-Type': 'application/json'}
+    if token:
+        headers['Authorization'] = f'Bearer {token}'
+    body = json.dumps(data).encode() if data is not None else None
+    req = urllib.request.Request(url, data=body, headers=headers)
+    with urllib.request.urlopen(req, timeout=30) as resp:
+        return resp.status, resp.read()
+
+
+def wait_until_up(port, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f'Server on port {port} did not start')
+
+
+def login(base_url):
+    user = {'username': 'loadtest', 'email': 'loadtest@example.com', 'password': 'loadtest'}
+    try:
+        request(f'{base_url}/auth/register', user)
+    except urllib.error.HTTPError as e:
+        if e.code != 409:
+            raise
+    _, body = request(f'{base_url}/auth/login', user)
+    return json.loads(body)['access_token']
+
+
+def run_load(url, token, total, concurrency):
+    def hit(_):
+        start = time.perf_counter()
+        try:
+            status, _ = request(url, token=token)
+        except Exception:
+            status = None
+        return status, time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(hit, range(total)))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for _, latency in results)
+    return {
+        'requests': total,
+        'errors': sum(1 for status, _ in results if status != 200),
+        'seconds': round(elapsed, 2),
+        'req_per_sec': round(total / elapsed, 1),
+        'p50_ms': round(latencies[len(latencies) // 2] * 1000, 1),
+        'p95_ms': round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 1)
+    }
+
+
+def benchmark(kind, args):
+    port = free_port()
+    base_url = f'http://127.0.0.1:{port}'
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DATABASE_URL=f'sqlite:///{tmp}/loadtest.db')
+        subprocess.run([sys.executable, '-c', 'from run import app, db\n'
+                        'with app.app_context(): db.create_all()'],
+                       cwd=BACKEND_DIR, env=env, check=True)
+        server = start_server(kind, port, env)
+        try:
+            wait_until_up(port)
+            token = login(base_url)
+            # Warm up connections and caches before timing
+            run_load(f'{base_url}{args.path}', token, min(50, args.requests), args.concurrency)
+            return run_load(f'{base_url}{args.path}', token, args.requests, args.concurrency)
+        finally:
+            server.terminate()
+            server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--server', choices=['dev', 'gunicorn', 'both'], default='both')
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--path', default='/api/entries')
+    args = parser.parse_args()
+
+    kinds = ['dev', 'gunicorn'] if args.server == 'both' else [args.server]
+    for kind in kinds:
+        result = benchmark(kind, args)
+        print(f"{kind:>9}: {result['req_per_sec']:>8} req/s  "
+              f"p50 {result['p50_ms']} ms  p95 {result['p95_ms']} ms  "
+              f"errors {result['errors']}/{result['requests']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Startup benchmark: import and create_app time, measured with -X importtime
+
+    python benchmarks/startup_time.py --runs 5 --top 15
+
+Each run is a fresh interpreter that imports the app and calls create_app, so
+the numbers match what a CLI command or test session pays before doing any
+work. Compare the default Config against the lean TestingConfig, or toggle
+ENABLE_MIGRATE / ENABLE_CORS / BLUEPRINTS in the environment.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SNIPPET = (
+    'import time; start = time.perf_counter()\n'
+    'import config; from app import create_app\n'
+    'create_app(getattr(config, {config!r}))\n'
+    'print(time.perf_counter() - start)\n'
+)
+
+
+def run(config_name, env, importtime=False):
+    flags = ['-X', 'importtime'] if importtime else []
+    return subprocess.run(
+        [sys.executable, *flags, '-c', SNIPPET.format(config=config_name)],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+    )
+
+
+def wall_time(config_name, env):
+    """Seconds spent importing the app and calling create_app"""
+    return float(run(config_name, env).stdout.strip().splitlines()[-1])
+
+
+def import_times(config_name, env):
+    """Cumulative microseconds per top-level import, from -X importtime"""
+    modules = {}
+    for line in run(config_name, env, importtime=True).stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # Nested imports are indented; they are already in their parent's total
+        if not name[1:].startswith(' '):
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--config', action='append', dest='configs',
+                        help='Config class to benchmark (repeatable); default Config and TestingConfig')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=10, help='Slowest top-level imports to list')
+    args = parser.parse_args()
+
+    env = dict(os.environ, FLASK_SKIP_DOTENV='1')
+    for config_name in args.configs or ['Config', 'TestingConfig']:
+        wall = [wall_time(config_name, env) * 1000 for _ in range(args.runs)]
+        imports = import_times(config_name, env)
+
+        print(f'{config_name}: create_app {statistics.median(wall):.1f} ms median '
+              f'(min {min(wall):.1f}, max {max(wall):.1f}) over {args.runs} runs')
+        slowest = sorted(imports.items(), key=lambda item: item[1], reverse=True)[:args.top]
+        for name, cumulative in slowest:
+            print(f'    {cumulative / 1000:8.1f} ms  {name}')
+        print(f'    {sum(imports.values()) / 1000:8.1f} ms  total imports')
+
+
+if __name__ == '__main__':
+    main()
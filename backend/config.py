@@ -3,9 +3,12 @@ Application Configuration
 """
 import os
 from datetime import timedelta
-from dotenv import load_dotenv
+from sqlalchemy.pool import StaticPool
 
-load_dotenv()
+# Same opt-out the flask CLI uses; tests skip the .env lookup entirely
+if os.environ.get('FLASK_SKIP_DOTENV') != '1':
+    from dotenv import load_dotenv
+    load_dotenv()
 
 
 class Config:
@@ -24,5 +27,42 @@ class Config:
     JWT_TOKEN_LOCATION = ['headers']  # Only use Authorization header, not cookies
     JWT_COOKIE_CSRF_PROTECT = False  # Disable CSRF protection for cookies
     
+    # Optional extensions and blueprints loaded by create_app
+    ENABLE_MIGRATE = os.environ.get('ENABLE_MIGRATE', 'true').lower() == 'true'
+    ENABLE_CORS = os.environ.get('ENABLE_CORS', 'true').lower() == 'true'
+    BLUEPRINTS = [name.strip() for name in
+                  os.environ.get('BLUEPRINTS', 'auth,projects,time_entries,jobs').split(',')
+                  if name.strip()]
+    
     # CORS
     CORS_HEADERS = 'Content-Type'
+    
+    # Background jobs
+    JOB_WORKERS = int(os.environ.get('JOB_WORKERS', 2))
+    JOB_BATCH_SIZE = int(os.environ.get('JOB_BATCH_SIZE', 1000))
+    JOB_STALE_AFTER = int(os.environ.get('JOB_STALE_AFTER', 300))  # Seconds queued, or running without a heartbeat, before a job is presumed abandoned
+    JOB_RUN_INLINE = False  # Run jobs in the calling request instead of the pool
+    
+    # Production server (gunicorn.conf.py)
+    SERVER_BIND = os.environ.get('SERVER_BIND', '0.0.0.0:5000')
+    SERVER_WORKERS = int(os.environ.get('SERVER_WORKERS', 2 * (os.cpu_count() or 1) + 1))
+    SERVER_THREADS = int(os.environ.get('SERVER_THREADS', 4))
+    SERVER_KEEPALIVE = int(os.environ.get('SERVER_KEEPALIVE', 5))  # Seconds
+    SERVER_TIMEOUT = int(os.environ.get('SERVER_TIMEOUT', 30))  # Seconds
+    SERVER_PRELOAD = os.environ.get('SERVER_PRELOAD', 'true').lower() == 'true'
+
+
+class TestingConfig(Config):
+    """Lean configuration for the test suite"""
+    TESTING = True
+    
+    # One in-memory SQLite database shared by every connection and thread
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'poolclass': StaticPool,
+        'connect_args': {'check_same_thread': False}
+    }
+    
+    ENABLE_MIGRATE = False
+    ENABLE_CORS = False
+    JOB_RUN_INLINE = True
@@ -0,0 +1,63 @@
+"""
+Shared pytest fixtures
+
+The app and its in-memory SQLite database are created once per test session;
+each test gets empty tables instead of a fresh app.
+"""
+import os
+
+os.environ.setdefault('FLASK_SKIP_DOTENV', '1')
+
+import pytest
+from flask_jwt_extended import create_access_token
+from app import create_app, db as _db
+from app.models import User
+from config import TestingConfig
+
+
+@pytest.fixture(scope='session')
+def app():
+    """Application configured with TestingConfig, shared by the whole session"""
+    app = create_app(TestingConfig)
+    with app.app_context():
+        _db.create_all()
+        yield app
+        _db.drop_all()
+
+
+def empty_tables():
+    """Delete every row and drop the session so nothing leaks into the next test"""
+    _db.session.rollback()
+    for table in reversed(_db.metadata.sorted_tables):
+        _db.session.execute(table.delete())
+    _db.session.commit()
+    _db.session.remove()
+
+
+@pytest.fixture
+def db(app):
+    """Database session; every table is emptied after the test"""
+    yield _db
+    empty_tables()
+
+
+@pytest.fixture
+def client(app, db):
+    """Test client for the shared app"""
+    return app.test_client()
+
+
+@pytest.fixture
+def user(db):
+    """A saved user to authenticate requests as"""
+    user = User(username='tester', email='tester@example.com')
+    user.set_password('password')
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+@pytest.fixture
+def auth_headers(user):
+    """Authorization header carrying an access token for `user`"""
+    return {'Authorization': f'Bearer {create_access_token(identity=str(user.id))}'}
@@ -10,5 +10,5 @@ echo "Database is ready!"
 echo "Running database migrations..."
 flask db upgrade
 
-echo "Starting Flask application..."
-exec python run.py
+echo "Starting Flask application with gunicorn..."
+exec gunicorn -c gunicorn.conf.py wsgi:app
@@ -0,0 +1,29 @@
+"""
+Gunicorn configuration, driven by the SERVER_* settings in Config
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+from config import Config
+
+bind = Config.SERVER_BIND
+workers = Config.SERVER_WORKERS
+threads = Config.SERVER_THREADS
+worker_class = 'gthread'
+keepalive = Config.SERVER_KEEPALIVE
+timeout = Config.SERVER_TIMEOUT
+preload_app = Config.SERVER_PRELOAD
+
+accesslog = '-'
+errorlog = '-'
+
+
+def post_fork(server, worker):
+    """Give each worker its own database connections and job threads"""
+    from app import reset_after_fork
+    from app.jobs import job_queue
+    from wsgi import app
+    reset_after_fork(app)
+
+    # Pick up jobs a previous worker left behind; claiming stops double runs
+    with app.app_context():
+        job_queue.requeue_stale()
@@ -19,4 +19,7 @@ def make_shell_context():
 
 
 if __name__ == '__main__':
+    from app.jobs import job_queue
+    with app.app_context():
+        job_queue.requeue_stale()
     app.run(debug=False, host='0.0.0.0', port=5000, use_reloader=False)
@@ -0,0 +1,36 @@
+"""
+Tests for the application factory and its config flags
+"""
+from app import create_app
+from app.models import Project, User
+from config import TestingConfig
+from conftest import empty_tables
+
+
+class BlueprintSubsetConfig(TestingConfig):
+    BLUEPRINTS = ['auth']
+
+
+def test_testing_config_skips_optional_extensions(app):
+    assert 'migrate' not in app.extensions
+    assert app.extensions['job_queue'] is not None
+    assert set(app.blueprints) == {'auth', 'projects', 'time_entries', 'jobs'}
+
+
+def test_only_configured_blueprints_are_registered():
+    app = create_app(BlueprintSubsetConfig)
+
+    assert set(app.blueprints) == {'auth'}
+    assert app.test_client().get('/api/projects').status_code == 404
+
+
+def test_db_fixture_cleanup_empties_every_table(db, user):
+    db.session.add(Project(name='Leftover'))
+    db.session.commit()
+    assert User.query.count() == 1
+
+    empty_tables()
+
+    assert all(db.session.execute(table.select()).first() is None for table in db.metadata.sorted_tables)
+    assert not db.session.identity_map
+    assert Project.query.count() == 0
@@ -0,0 +1,156 @@
+"""
+Tests for archiving time entries and querying across the archive
+"""
+from datetime import datetime, timedelta
+import pytest
+from app.archive import archive_entries
+from app.models import Project, TimeEntry, ArchivedTimeEntry, TimeEntryMonthlySummary
+
+QUERIES = [
+    '',
+    '?start_date=2023-03-15',
+    '?end_date=2023-05-10',
+    '?start_date=2023-02-10&end_date=2023-06-20',
+    '?start_date=2023-03-05&end_date=2023-03-25',
+    '?start_date=2023-02-01&end_date=2023-05-01',
+    '?start_date=2023-08-01',
+]
+
+
+def add_entry(db, user, project, start_time, hours=2, is_billable=True, closed=True):
+    entry = TimeEntry(
+        user_id=user.id,
+        project_id=project.id,
+        start_time=start_time,
+        end_time=start_time + timedelta(hours=hours) if closed else None,
+        is_billable=is_billable
+    )
+    entry.calculate_duration()
+    db.session.add(entry)
+    db.session.commit()
+    return entry
+
+
+@pytest.fixture
+def projects(db, user):
+    """Two projects with entries every five days from January to August 2023"""
+    first = Project(name='First')
+    second = Project(name='Second')
+    db.session.add_all([first, second])
+    db.session.commit()
+    for i in range(45):
+        start = datetime(2023, 1, 1, 9) + timedelta(days=i * 5)
+        add_entry(db, user, first if i % 3 else second, start, hours=1 + i % 4, is_billable=i % 2 == 0)
+    return first, second
+
+
+def snapshot(client, auth_headers, queries):
+    return [
+        (client.get(f'/api/entries/summary{query}', headers=auth_headers).json,
+         [entry['id'] for entry in client.get(f'/api/entries{query}', headers=auth_headers).json])
+        for query in queries
+    ]
+
+
+def test_results_unchanged_after_archiving(client, auth_headers, projects):
+    first, _ = projects
+    queries = QUERIES + [f'?project_id={first.id}{"&" + q[1:] if q else ""}' for q in QUERIES]
+    queries += ['?is_billable=true', '?is_billable=false&start_date=2023-04-10']
+    before = snapshot(client, auth_headers, queries)
+
+    cutoff, archived = archive_entries(datetime(2023, 6, 15))
+
+    assert cutoff == datetime(2023, 6, 1)
+    assert archived == ArchivedTimeEntry.query.count() > 0
+    assert TimeEntry.query.filter(TimeEntry.start_time < cutoff).count() == 0
+    assert snapshot(client, auth_headers, queries) == before
+
+
+def test_archived_entries_are_flagged(client, auth_headers, projects):
+    archive_entries(datetime(2023, 3, 1))
+
+    entries = client.get('/api/entries', headers=auth_headers).json
+    assert all(entry['is_archived'] == (entry['start_time'] < '2023-03-01') for entry in entries)
+
+
+def test_recent_range_does_not_read_archive(client, auth_headers, projects, monkeypatch):
+    archive_entries(datetime(2023, 3, 1))
+
+    def fail(*args, **kwargs):
+        raise AssertionError('archive should not be queried')
+    monkeypatch.setattr('app.archive.get_archived_entries', fail)
+    monkeypatch.setattr('app.archive.get_archived_totals', fail)
+
+    assert client.get('/api/entries?start_date=2023-04-01', headers=auth_headers).status_code == 200
+    assert client.get('/api/entries/summary?start_date=2023-04-01', headers=auth_headers).status_code == 200
+
+
+def test_repeated_runs_merge_into_existing_summaries(client, auth_headers, db, user, projects):
+    first, _ = projects
+    archive_entries(datetime(2023, 4, 1))
+    march = TimeEntryMonthlySummary.query.filter_by(project_id=first.id, month=datetime(2023, 3, 1).date()).one()
+    count, total = march.entry_count, march.total_duration
+
+    # A backdated entry into an already archived month
+    add_entry(db, user, first, datetime(2023, 3, 20, 14), hours=3)
+    before = snapshot(client, auth_headers, QUERIES)
+    archive_entries(datetime(2023, 7, 1))
+
+    db.session.refresh(march)
+    assert (march.entry_count, march.total_duration) == (count + 1, total + 3 * 3600)
+    assert snapshot(client, auth_headers, QUERIES) == before
+
+
+def test_running_timers_are_not_archived(client, auth_headers, db, user, projects):
+    first, _ = projects
+    timer = add_entry(db, user, first, datetime(2023, 1, 20, 9), closed=False)
+
+    archive_entries(datetime(2024, 1, 10))
+
+    assert db.session.get(ArchivedTimeEntry, timer.id) is None
+    response = client.put(f'/api/entries/{timer.id}', headers=auth_headers,
+                          json={'end_time': '2023-01-20T17:00:00'})
+    assert response.status_code == 200
+    assert response.json['entry']['duration'] == 8 * 3600
+
+
+def test_archive_with_nothing_to_move(db):
+    assert archive_entries(datetime(2023, 1, 15)) == (datetime(2023, 1, 1), 0)
+
+
+def test_timezone_aware_dates_after_archiving(client, auth_headers, projects):
+    before = snapshot(client, auth_headers, ['?start_date=2023-03-01T00:00:00'])
+    archive_entries(datetime(2023, 6, 1))
+
+    for query in ['?start_date=2023-03-01T00:00:00Z', '?start_date=2023-03-01T02:00:00%2B02:00']:
+        assert snapshot(client, auth_headers, [query]) == before
+    response = client.get('/api/entries/summary?start_date=2023-01-01T00:00:00Z&end_date=2023-05-15T00:00:00-05:00',
+                          headers=auth_headers)
+    assert response.status_code == 200
+
+
+def test_archived_ids_are_not_reused(client, auth_headers, db, user, projects):
+    first, _ = projects
+    # Backdated entry with the highest id, then archived
+    backdated_id = add_entry(db, user, first, datetime(2022, 12, 1, 9)).id
+    archive_entries(datetime(2023, 1, 1))
+    assert db.session.get(ArchivedTimeEntry, backdated_id) is not None
+
+    new = add_entry(db, user, first, datetime(2022, 12, 2, 9))
+    assert new.id > backdated_id
+
+    archive_entries(datetime(2023, 1, 1))
+    ids = [entry['id'] for entry in client.get('/api/entries', headers=auth_headers).json]
+    assert len(ids) == len(set(ids))
+
+
+def test_project_stats_include_archived_entries(client, auth_headers, projects):
+    first, second = projects
+    urls = [f'/api/projects/{project.id}?include_stats=true' for project in (first, second)]
+    before = [client.get(url, headers=auth_headers).json for url in urls]
+    listed = client.get('/api/projects?include_stats=true', headers=auth_headers).json
+
+    archive_entries(datetime(2023, 6, 1))
+
+    assert [client.get(url, headers=auth_headers).json for url in urls] == before
+    assert client.get('/api/projects?include_stats=true', headers=auth_headers).json == listed
@@ -0,0 +1,57 @@
+"""
+Tests for authentication routes
+"""
+from app.models import RevokedToken
+
+
+def register(client, **overrides):
+    data = {'username': 'alice', 'email': 'alice@example.com', 'password': 'secret'}
+    data.update(overrides)
+    return client.post('/auth/register', json=data)
+
+
+def test_register_and_login(client):
+    response = register(client, first_name='Alice')
+    assert response.status_code == 201
+    assert response.json['user']['first_name'] == 'Alice'
+
+    response = client.post('/auth/login', json={'username': 'alice', 'password': 'secret'})
+    assert response.status_code == 200
+    assert response.json['access_token']
+    assert response.json['refresh_token']
+
+
+def test_register_rejects_duplicates_and_missing_fields(client):
+    register(client)
+
+    assert register(client, email='other@example.com').status_code == 409
+    assert register(client, username='bob').status_code == 409
+    assert client.post('/auth/register', json={'username': 'bob'}).status_code == 400
+
+
+def test_login_with_wrong_password(client):
+    register(client)
+
+    response = client.post('/auth/login', json={'username': 'alice', 'password': 'wrong'})
+
+    assert response.status_code == 401
+
+
+def test_me_requires_token(client, user, auth_headers):
+    assert client.get('/auth/me').status_code == 401
+    assert client.get('/auth/me', headers=auth_headers).json['username'] == user.username
+
+
+def test_logout_revokes_token(client, auth_headers):
+    assert client.post('/auth/logout', headers=auth_headers).status_code == 200
+    assert client.get('/auth/me', headers=auth_headers).status_code == 401
+
+
+
+def test_revoked_tokens_are_stored_in_database(client, db, auth_headers):
+    client.post('/auth/logout', headers=auth_headers)
+
+    # Every worker process reads revocations from the shared database
+    revoked = RevokedToken.query.one()
+    assert RevokedToken.is_revoked(revoked.jti)
+    assert not RevokedToken.is_revoked('unknown-jti')
@@ -0,0 +1,226 @@
+"""
+Tests for the background job queue and project deletion
+"""
+from datetime import datetime, timedelta
+from flask_jwt_extended import create_access_token
+from sqlalchemy import update
+from app import tasks
+from app.jobs import job_queue
+from app.models import Job, Project, TimeEntry, User
+
+
+def make_project(db, user, entries=0, name='Doomed'):
+    project = Project(name=name)
+    db.session.add(project)
+    db.session.commit()
+    for i in range(entries):
+        start = datetime(2024, 1, 1, 9) + timedelta(days=i)
+        db.session.add(TimeEntry(user_id=user.id, project_id=project.id, start_time=start,
+                                 end_time=start + timedelta(hours=1), duration=3600))
+    db.session.commit()
+    return project
+
+
+def test_delete_project_runs_as_job(client, db, user, auth_headers, app, monkeypatch):
+    monkeypatch.setitem(app.config, 'JOB_BATCH_SIZE', 3)
+    project_id = make_project(db, user, entries=10).id
+
+    response = client.delete(f'/api/projects/{project_id}', headers=auth_headers)
+
+    assert response.status_code == 202
+    job = response.json['job']
+    assert job['name'] == 'delete_project'
+    assert job['status'] == 'completed'
+    assert job['result']['time_entries'] == 10
+    assert Project.query.filter_by(id=project_id).count() == 0
+    assert TimeEntry.query.count() == 0
+
+
+def test_get_job_is_limited_to_its_owner(client, db, user, auth_headers):
+    project = make_project(db, user)
+    job_id = client.delete(f'/api/projects/{project.id}', headers=auth_headers).json['job']['id']
+
+    other = User(username='other', email='other@example.com', password_hash='x')
+    db.session.add(other)
+    db.session.commit()
+    other_headers = {'Authorization': f'Bearer {create_access_token(identity=str(other.id))}'}
+
+    assert client.get(f'/api/jobs/{job_id}', headers=auth_headers).json['status'] == 'completed'
+    assert client.get(f'/api/jobs/{job_id}', headers=other_headers).status_code == 404
+    assert client.get('/api/jobs/9999', headers=auth_headers).status_code == 404
+
+
+def test_failed_job_records_error(db, monkeypatch):
+    def boom():
+        raise RuntimeError('boom')
+    monkeypatch.setitem(job_queue.tasks, 'boom', boom)
+
+    job = job_queue.enqueue('boom')
+
+    assert job.status == 'failed'
+    assert job.error == 'boom'
+    assert job.finished_at is not None
+
+
+def test_failed_deletion_restores_project(client, db, user, auth_headers, monkeypatch):
+    project = make_project(db, user, entries=2)
+    project.status = 'completed'
+    db.session.commit()
+
+    def fail(*args):
+        raise RuntimeError('database went away')
+    monkeypatch.setattr('app.tasks.delete_in_batches', fail)
+    response = client.delete(f'/api/projects/{project.id}', headers=auth_headers)
+
+    assert response.json['job']['status'] == 'failed'
+    assert client.get(f'/api/projects/{project.id}', headers=auth_headers).json['status'] == 'completed'
+
+    monkeypatch.undo()
+    response = client.delete(f'/api/projects/{project.id}', headers=auth_headers)
+    assert response.json['job']['status'] == 'completed'
+
+
+def test_deleting_project_is_hidden(client, db, user, auth_headers):
+    project = make_project(db, user, entries=1)
+    project.status = 'deleting'
+    db.session.commit()
+    entry = TimeEntry.query.first()
+
+    assert client.get('/api/projects', headers=auth_headers).json == []
+    assert client.get(f'/api/projects/{project.id}', headers=auth_headers).status_code == 404
+    assert client.put(f'/api/projects/{project.id}', headers=auth_headers,
+                      json={'status': 'active'}).status_code == 404
+    assert client.post('/api/entries', headers=auth_headers, json={
+        'project_id': project.id, 'start_time': '2024-02-01T09:00:00'
+    }).status_code == 404
+    assert client.put(f'/api/entries/{entry.id}', headers=auth_headers,
+                      json={'project_id': project.id}).status_code == 404
+
+
+def test_status_deleting_cannot_be_set(client, db, user, auth_headers):
+    project = make_project(db, user)
+
+    response = client.put(f'/api/projects/{project.id}', headers=auth_headers, json={'status': 'deleting'})
+
+    assert response.status_code == 400
+    assert db.session.get(Project, project.id).status == 'active'
+
+
+def test_delete_reports_job_in_progress(client, db, user, auth_headers):
+    project = make_project(db, user)
+    project.status = 'deleting'
+    job = Job(name='delete_project', user_id=user.id, status='running',
+              started_at=datetime.utcnow(), payload={'project_id': project.id})
+    db.session.add(job)
+    db.session.commit()
+
+    response = client.delete(f'/api/projects/{project.id}', headers=auth_headers)
+
+    assert response.status_code == 202
+    assert response.json['job']['id'] == job.id
+    assert db.session.get(Project, project.id) is not None
+
+
+def test_delete_requeues_abandoned_job(client, db, user, auth_headers):
+    project = make_project(db, user, entries=2)
+    project_id = project.id
+    project.status = 'deleting'
+    stale = Job(name='delete_project', user_id=user.id, status='running',
+                started_at=datetime.utcnow() - timedelta(days=1),
+                payload={'project_id': project_id, 'previous_status': 'active'})
+    db.session.add(stale)
+    db.session.commit()
+    stale_id = stale.id
+
+    response = client.delete(f'/api/projects/{project_id}', headers=auth_headers)
+
+    assert response.status_code == 202
+    assert response.json['job']['id'] != stale_id
+    assert response.json['job']['status'] == 'completed'
+    assert db.session.get(Job, stale_id).status == 'failed'
+    assert Project.query.filter_by(id=project_id).count() == 0
+
+
+def test_requeue_stale_runs_abandoned_jobs(db, user):
+    project_id = make_project(db, user, entries=3).id
+    old = datetime.utcnow() - timedelta(days=1)
+    abandoned = [
+        Job(name='delete_project', status='queued', created_at=old, payload={'project_id': project_id}),
+        Job(name='delete_project', status='running', created_at=old, started_at=old,
+            payload={'project_id': project_id})
+    ]
+    fresh = Job(name='delete_project', status='running', started_at=datetime.utcnow(),
+                payload={'project_id': project_id})
+    db.session.add_all(abandoned + [fresh])
+    db.session.commit()
+
+    assert job_queue.requeue_stale() == 2
+
+    db.session.expire_all()
+    assert [job.status for job in abandoned] == ['completed', 'completed']
+    assert fresh.status == 'running'
+    assert Project.query.filter_by(id=project_id).count() == 0
+
+
+def test_deletion_records_heartbeat(client, db, user, auth_headers, app, monkeypatch):
+    monkeypatch.setitem(app.config, 'JOB_BATCH_SIZE', 3)
+    beats = []
+    heartbeat = job_queue.heartbeat
+    monkeypatch.setattr(job_queue, 'heartbeat', lambda: beats.append(1) or heartbeat())
+    project_id = make_project(db, user, entries=7).id
+
+    job = client.delete(f'/api/projects/{project_id}', headers=auth_headers).json['job']
+
+    assert job['status'] == 'completed'
+    assert job['attempts'] == 1
+    assert job['heartbeat_at'] is not None
+    # Three entry batches, the empty final checks on three tables, and the project row
+    assert len(beats) == 7
+
+
+def test_long_running_job_with_heartbeat_is_not_requeued(client, db, user, auth_headers):
+    project = make_project(db, user)
+    project.status = 'deleting'
+    job = Job(name='delete_project', user_id=user.id, status='running', attempts=1,
+              started_at=datetime.utcnow() - timedelta(days=1), heartbeat_at=datetime.utcnow(),
+              payload={'project_id': project.id})
+    db.session.add(job)
+    db.session.commit()
+
+    assert job_queue.requeue_stale() == 0
+    response = client.delete(f'/api/projects/{project.id}', headers=auth_headers)
+    assert response.json['job']['id'] == job.id
+    assert db.session.get(Job, job.id).status == 'running'
+
+
+def test_taken_over_job_stops_without_touching_its_row(db, monkeypatch):
+    def takeover():
+        job_id = Job.query.one().id
+        # Another worker requeued and claimed the job while this run was silent
+        db.session.execute(update(Job).where(Job.id == job_id).values(attempts=Job.attempts + 1))
+        db.session.commit()
+        job_queue.heartbeat()
+    monkeypatch.setitem(job_queue.tasks, 'takeover', takeover)
+
+    job = job_queue.enqueue('takeover')
+
+    assert job.status == 'running'
+    assert job.attempts == 2
+    assert job.error is None
+
+
+def test_taken_over_deletion_keeps_project_deleting(client, db, user, auth_headers, monkeypatch):
+    project_id = make_project(db, user, entries=2).id
+    original = tasks.delete_in_batches
+
+    def delete_after_takeover(*args):
+        db.session.execute(update(Job).values(attempts=Job.attempts + 1))
+        db.session.commit()
+        return original(*args)
+    monkeypatch.setattr('app.tasks.delete_in_batches', delete_after_takeover)
+
+    job = client.delete(f'/api/projects/{project_id}', headers=auth_headers).json['job']
+
+    assert job['status'] == 'running'
+    assert db.session.get(Project, project_id).status == 'deleting'
+    assert TimeEntry.query.count() == 2
@@ -0,0 +1,53 @@
+"""
+Tests for project routes
+"""
+
+
+def create_project(client, headers, **overrides):
+    data = {'name': 'Website', 'description': 'Redesign'}
+    data.update(overrides)
+    return client.post('/api/projects', headers=headers, json=data)
+
+
+def test_create_and_list_projects(client, auth_headers):
+    response = create_project(client, auth_headers)
+    assert response.status_code == 201
+    assert response.json['project']['status'] == 'active'
+
+    projects = client.get('/api/projects', headers=auth_headers).json
+    assert [project['name'] for project in projects] == ['Website']
+
+
+def test_create_requires_name(client, auth_headers):
+    assert client.post('/api/projects', headers=auth_headers, json={}).status_code == 400
+
+
+def test_update_project(client, auth_headers):
+    project_id = create_project(client, auth_headers).json['project']['id']
+
+    response = client.put(f'/api/projects/{project_id}', headers=auth_headers,
+                          json={'name': 'Webshop', 'status': 'completed'})
+
+    assert response.status_code == 200
+    assert response.json['project']['name'] == 'Webshop'
+    assert client.get('/api/projects?status=completed', headers=auth_headers).json[0]['id'] == project_id
+
+
+def test_get_project_with_stats(client, auth_headers):
+    project_id = create_project(client, auth_headers).json['project']['id']
+    client.post('/api/entries', headers=auth_headers, json={
+        'project_id': project_id,
+        'start_time': '2024-03-01T09:00:00',
+        'end_time': '2024-03-01T12:00:00'
+    })
+
+    project = client.get(f'/api/projects/{project_id}?include_stats=true', headers=auth_headers).json
+
+    assert project['total_hours'] == 3
+    assert project['entry_count'] == 1
+
+
+def test_missing_project(client, auth_headers):
+    assert client.get('/api/projects/999', headers=auth_headers).status_code == 404
+    assert client.put('/api/projects/999', headers=auth_headers, json={}).status_code == 404
+    assert client.delete('/api/projects/999', headers=auth_headers).status_code == 404
@@ -0,0 +1,87 @@
+"""
+Tests for time entry routes
+"""
+import pytest
+from flask_jwt_extended import create_access_token
+from app.models import Project, User
+
+
+@pytest.fixture
+def project(db):
+    project = Project(name='Client work')
+    db.session.add(project)
+    db.session.commit()
+    return project
+
+
+def create_entry(client, headers, project, start, end=None, **overrides):
+    data = {'project_id': project.id, 'start_time': start, 'end_time': end}
+    data.update(overrides)
+    return client.post('/api/entries', headers=headers, json=data)
+
+
+def test_create_entry_calculates_duration(client, auth_headers, project):
+    response = create_entry(client, auth_headers, project, '2024-03-01T09:00:00', '2024-03-01T10:30:00')
+
+    assert response.status_code == 201
+    assert response.json['entry']['duration'] == 5400
+    assert response.json['entry']['duration_hours'] == 1.5
+
+
+def test_create_entry_validation(client, auth_headers, project):
+    assert client.post('/api/entries', headers=auth_headers, json={}).status_code == 400
+    assert create_entry(client, auth_headers, project, 'not-a-date').status_code == 400
+    assert client.post('/api/entries', headers=auth_headers, json={
+        'project_id': 999, 'start_time': '2024-03-01T09:00:00'
+    }).status_code == 404
+
+
+def test_list_filters(client, auth_headers, project):
+    create_entry(client, auth_headers, project, '2024-03-01T09:00:00', '2024-03-01T10:00:00')
+    create_entry(client, auth_headers, project, '2024-03-05T09:00:00', '2024-03-05T10:00:00',
+                 is_billable=False)
+
+    entries = client.get('/api/entries', headers=auth_headers).json
+    assert [entry['start_time'] for entry in entries] == ['2024-03-05T09:00:00', '2024-03-01T09:00:00']
+
+    assert len(client.get('/api/entries?start_date=2024-03-02', headers=auth_headers).json) == 1
+    assert len(client.get('/api/entries?is_billable=false', headers=auth_headers).json) == 1
+    assert client.get('/api/entries?start_date=bad', headers=auth_headers).status_code == 400
+
+
+def test_update_and_delete_entry(client, auth_headers, project):
+    entry_id = create_entry(client, auth_headers, project, '2024-03-01T09:00:00').json['entry']['id']
+
+    response = client.put(f'/api/entries/{entry_id}', headers=auth_headers,
+                          json={'end_time': '2024-03-01T11:00:00', 'notes': 'Done'})
+    assert response.json['entry']['duration'] == 7200
+    assert response.json['entry']['notes'] == 'Done'
+
+    assert client.delete(f'/api/entries/{entry_id}', headers=auth_headers).status_code == 200
+    assert client.get(f'/api/entries/{entry_id}', headers=auth_headers).status_code == 404
+
+
+def test_entries_are_private(client, db, auth_headers, project):
+    entry_id = create_entry(client, auth_headers, project, '2024-03-01T09:00:00').json['entry']['id']
+    other = User(username='other', email='other@example.com', password_hash='x')
+    db.session.add(other)
+    db.session.commit()
+    other_headers = {'Authorization': f'Bearer {create_access_token(identity=str(other.id))}'}
+
+    assert client.get(f'/api/entries/{entry_id}', headers=other_headers).status_code == 404
+    assert client.get('/api/entries', headers=other_headers).json == []
+
+
+def test_summary(client, auth_headers, project):
+    create_entry(client, auth_headers, project, '2024-03-01T09:00:00', '2024-03-01T11:00:00')
+    create_entry(client, auth_headers, project, '2024-03-02T09:00:00', '2024-03-02T10:00:00',
+                 is_billable=False)
+
+    summary = client.get('/api/entries/summary', headers=auth_headers).json
+
+    assert summary == {
+        'total_entries': 2,
+        'total_hours': 3.0,
+        'billable_hours': 2.0,
+        'non_billable_hours': 1.0
+    }